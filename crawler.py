@@ -6,24 +6,32 @@ Respects robots.txt and saves HTML content and linked files.
 """
 
 import argparse
+import asyncio
 import hashlib
 import json
 import os
 import random
+import re
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Set, Tuple, List
-from urllib.parse import urljoin, urlparse, urlunparse
+from typing import Optional, Pattern, Set, Tuple, List
+from urllib.parse import ParseResult, urljoin, urlparse, urlunparse
 from urllib.robotparser import RobotFileParser
 
 try:
-    import requests
-    from bs4 import BeautifulSoup
+    import aiohttp
+    import lxml.etree
+    import yarl
 except ImportError as e:
     print(f"Error: Required library not found: {e}")
-    print("Please install: pip install requests beautifulsoup4")
+    print("Please install: pip install aiohttp lxml")
     sys.exit(1)
 
 try:
@@ -32,6 +40,178 @@ try:
 except ImportError:
     TQDM_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Linked documents that are downloaded rather than parsed for links
+FILE_EXTS = frozenset({'.pdf', '.doc', '.docx'})
+
+# Transient server errors that are worth retrying
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+# (epoch second, YYYYMMDD) of the last date_dir computed by today_str()
+_date_cache = (0, '')
+
+
+@lru_cache(maxsize=100_000)
+def parse_url(url: str) -> ParseResult:
+    """Cached urlparse; the same URLs are parsed again and again during a crawl."""
+    return urlparse(url)
+
+
+def hash_url(url: str) -> str:
+    """Short BLAKE2b hex digest of a URL, used to derive file names."""
+    return hashlib.blake2b(url.encode(), digest_size=10).hexdigest()
+
+
+def is_file_path(path: str) -> bool:
+    """Check whether a URL path points to a downloadable document."""
+    return os.path.splitext(path)[1].lower() in FILE_EXTS
+
+
+def today_str() -> str:
+    """Today's date as YYYYMMDD, formatted at most once per second."""
+    global _date_cache
+    sec = int(time.time())
+    cached_sec, date_str = _date_cache
+    if sec != cached_sec:
+        date_str = datetime.fromtimestamp(sec).strftime("%Y%m%d")
+        # A single tuple assignment, so concurrent threads never see a torn pair
+        _date_cache = (sec, date_str)
+    return date_str
+
+
+def compile_link_filter(seed_netloc: str) -> Pattern:
+    """
+    Compile a regex that cheaply pre-screens raw hrefs for a seed.
+    
+    Matches absolute or scheme-relative links to the seed's host and relative
+    links, rejecting other hosts and schemes such as mailto: or javascript:
+    before any URL parsing. seed_netloc is the punycode form, so absolute links
+    whose host has non-ASCII or percent-encoded characters are let through for
+    yarl to normalize and should_follow to decide.
+    """
+    return re.compile(
+        rf'(?:(?:https?:)?//{re.escape(seed_netloc)}(?:[/?#]|$)'
+        r'|(?:https?:)?//[^/?#]*(?:[^\x00-\x7f]|%)'
+        r'|$|[?#]|/(?:[^/]|$)|[^:/?#]+(?:[/?#]|$))',
+        re.IGNORECASE
+    )
+
+
+def is_html_page(url: str, content_type: str) -> bool:
+    """Check whether a page is HTML that can be parsed for links."""
+    return 'text/html' in content_type and not is_file_path(parse_url(url).path)
+
+
+def get_charset(content_type: str) -> Optional[str]:
+    """Extract the charset parameter from a Content-Type header value."""
+    for param in content_type.split(';')[1:]:
+        name, _, value = param.partition('=')
+        if name.strip() == 'charset' and value.strip():
+            return value.strip().strip('"\'')
+    return None
+
+
+class LinkCollector:
+    """
+    lxml parser target that records link hrefs as tags are parsed.
+    
+    Receiving start-tag callbacks instead of building a tree keeps memory
+    flat no matter how large the page is.
+    """
+    
+    def __init__(self):
+        self.hrefs: List[str] = []
+        self.base_href: Optional[str] = None
+    
+    def start(self, tag: str, attrib):
+        if tag == 'a':
+            href = attrib.get('href')
+            if href is not None:
+                self.hrefs.append(href)
+        elif tag == 'base' and self.base_href is None:
+            self.base_href = attrib.get('href')
+    
+    def close(self) -> 'LinkCollector':
+        return self
+
+
+def extract_links(html_content: bytes, base_url: str, encoding: Optional[str] = None,
+                  link_filter: Optional[Pattern] = None) -> Set[Tuple[str, str, str]]:
+    """
+    Parse HTML content and extract all links.
+    
+    Module-level so it can be sent to a process pool.
+    
+    Args:
+        html_content: Raw HTML bytes
+        base_url: Base URL for resolving relative links
+        encoding: Charset from the Content-Type header, if known
+        link_filter: Regex from compile_link_filter; non-matching hrefs are skipped
+        
+    Returns:
+        Set of (absolute_url, netloc, path) tuples for links found in the page
+    """
+    links = set()
+    
+    try:
+        parser = lxml.etree.HTMLParser(target=LinkCollector(), encoding=encoding)
+    except LookupError:
+        # Unknown charset, let lxml detect it
+        parser = lxml.etree.HTMLParser(target=LinkCollector())
+    collector = lxml.etree.fromstring(html_content, parser)
+    
+    # Honour <base href> when resolving relative links
+    link_base = yarl.URL(base_url)
+    base_href = (collector.base_href or '').strip()
+    if base_href:
+        link_base = link_base.join(yarl.URL(base_href))
+    
+    # Only anchor hrefs are needed, and no tree is built to find them
+    for href in collector.hrefs:
+        href = href.strip()
+        if link_filter and not link_filter.match(href):
+            continue
+        
+        # Resolve relative URLs and remove fragment in one parse
+        try:
+            link = link_base.join(yarl.URL(href)).with_fragment(None)
+        except ValueError:
+            continue  # Malformed href, e.g. a broken IPv6 host
+        links.add((str(link), link.raw_authority, link.raw_path))
+    
+    return links
+
+
+class UrlSet:
+    """
+    Set of URLs stored as 16-byte BLAKE2b digests.
+    
+    Only membership is needed for visited URLs, so keeping digests instead of
+    the URL strings bounds memory on large crawls.
+    """
+    
+    def __init__(self):
+        self.digests: Set[bytes] = set()
+    
+    @staticmethod
+    def digest(url: str) -> bytes:
+        return hashlib.blake2b(url.encode(), digest_size=16).digest()
+    
+    def add(self, url: str):
+        self.digests.add(self.digest(url))
+    
+    def __contains__(self, url: str) -> bool:
+        return self.digest(url) in self.digests
+    
+    def __len__(self) -> int:
+        return len(self.digests)
+
 
 class Crawler:
     """Main crawler class that handles web crawling with configurable options."""
@@ -39,16 +219,27 @@ class Crawler:
     def __init__(self, args):
         """Initialize crawler with command-line arguments."""
         self.args = args
-        self.visited_urls: Set[str] = set()
+        self.visited_urls = UrlSet()
         self.robots_cache: dict = {}  # Cache robots.txt parsers by domain
-        self.session = requests.Session()
-        self.session.headers.update({'User-Agent': args.user_agent})
-        self.pages_crawled = 0
+        self.host_locks: dict = {}  # One in-flight request per host
+        self.next_allowed_time: dict = {}  # Earliest next request time per host
+        self.session: Optional[aiohttp.ClientSession] = None  # Created in run()
+        self.executor: Optional[ThreadPoolExecutor] = None  # Created in run()
+        self.parse_pool: Optional[ProcessPoolExecutor] = None  # Created in run() if enabled
+        self.index_lock = threading.Lock()  # Serializes index.jsonl appends
+        self.index_fh = None  # Buffered index.jsonl handle, opened on first write
+        self.index_records = 0
+        self.pages_crawled = 0  # Successfully fetched pages
+        self.pages_reserved = 0  # Fetches in flight that count against max_pages
+        self.budget_changed = asyncio.Condition()  # Notified when a reservation ends
+        self.resumed_pages: dict = {}  # URL digest -> (saved_path, charset), or None if not HTML
+        self.created_dirs: Set[Path] = set()  # Directories already ensured by ensure_dir()
         
         # Create necessary directories
         self.raw_dir = Path('./data/raw')
         self.raw_files_dir = Path('./data/raw_files')
         self.index_file = Path('./data/raw/index.jsonl')
+        self.robots_cache_dir = Path('./data/robots_cache')
         
         # Progress bar
         self.pbar = None
@@ -80,9 +271,9 @@ class Crawler:
             self.log(f"Error reading seeds file: {e}", "ERROR")
             return []
     
-    def get_robots_parser(self, url: str) -> Optional[RobotFileParser]:
+    async def get_robots_parser(self, url: str) -> Optional[RobotFileParser]:
         """Get or create a RobotFileParser for the given URL's domain."""
-        parsed = urlparse(url)
+        parsed = parse_url(url)
         base_url = f"{parsed.scheme}://{parsed.netloc}"
         
         if base_url in self.robots_cache:
@@ -93,8 +284,32 @@ class Crawler:
         rp = RobotFileParser()
         rp.set_url(robots_url)
         
+        # Reuse a robots.txt fetched by a recent run
+        cache_path = self.robots_cache_path(base_url)
+        lines = self.read_robots_cache(cache_path)
+        if lines is not None:
+            rp.parse(lines)
+            self.robots_cache[base_url] = rp
+            self.log(f"Loaded cached robots.txt for {base_url}")
+            return rp
+        
         try:
-            rp.read()
+            # Mirror RobotFileParser.read(), but fetch through the shared session.
+            # Access rules are stored as equivalent robots.txt text so they can be cached.
+            robots_text = None
+            async with self.session.get(robots_url) as response:
+                if response.status in (401, 403):
+                    robots_text = "User-agent: *\nDisallow: /\n"
+                elif 400 <= response.status < 500:
+                    robots_text = ""
+                elif response.status < 400:
+                    raw = await response.read()
+                    robots_text = raw.decode('utf-8', errors='replace')
+            
+            # Server errors leave the parser unread (disallow all) and are not cached
+            if robots_text is not None:
+                rp.parse(robots_text.splitlines())
+                self.write_robots_cache(cache_path, robots_text)
             self.robots_cache[base_url] = rp
             self.log(f"Loaded robots.txt from {robots_url}")
             return rp
@@ -104,14 +319,49 @@ class Crawler:
             self.robots_cache[base_url] = None
             return None
     
-    def can_fetch(self, url: str) -> bool:
+    def robots_cache_path(self, base_url: str) -> Path:
+        """Path of the on-disk robots.txt cache file for scheme://host."""
+        return self.robots_cache_dir / f"{hash_url(base_url)}.txt"
+    
+    def read_robots_cache(self, cache_path: Path) -> Optional[List[str]]:
+        """Return cached robots.txt lines if the cache file is younger than the TTL."""
+        if self.args.robots_ttl <= 0:
+            return None
+        
+        try:
+            if time.time() - cache_path.stat().st_mtime < self.args.robots_ttl:
+                return cache_path.read_text(encoding='utf-8').splitlines()
+        except OSError:
+            pass  # Missing or unreadable cache file, fetch again
+        return None
+    
+    def write_robots_cache(self, cache_path: Path, robots_text: str):
+        """Store robots.txt text on disk; the file mtime records the fetch time."""
+        if self.args.robots_ttl <= 0:
+            return
+        
+        try:
+            self.ensure_dir(cache_path.parent)
+            cache_path.write_text(robots_text, encoding='utf-8')
+        except OSError as e:
+            self.log(f"Error caching robots.txt to {cache_path}: {e}", "WARNING")
+    
+    async def can_fetch(self, url: str) -> bool:
         """Check if URL can be fetched according to robots.txt."""
-        rp = self.get_robots_parser(url)
+        rp = await self.get_robots_parser(url)
         if rp:
             return rp.can_fetch(self.args.user_agent, url)
         return True  # If no robots.txt, allow fetching
     
-    def fetch_page(self, url: str) -> Tuple[Optional[bytes], int, str, int]:
+    async def wait_for_host(self, host: str):
+        """Sleep until the politeness delay for host has elapsed."""
+        loop = asyncio.get_running_loop()
+        delay = self.next_allowed_time.get(host, 0.0) - loop.time()
+        if delay > 0:
+            self.log(f"Waiting {delay:.2f} seconds before next request to {host}")
+            await asyncio.sleep(delay)
+    
+    async def fetch_page(self, url: str) -> Tuple[Optional[bytes], int, str, int]:
         """
         Fetch a page with retry logic for transient errors.
         
@@ -122,26 +372,45 @@ class Crawler:
             try:
                 self.log(f"Fetching URL (attempt {attempt + 1}/3): {url}")
                 
-                response = self.session.get(
-                    url,
-                    timeout=30,
-                    allow_redirects=True
-                )
-                
-                content_type = response.headers.get('Content-Type', '').lower()
-                content_length = len(response.content)
-                
-                return response.content, response.status_code, content_type, content_length
+                async with self.session.get(url, allow_redirects=True) as response:
+                    # The last attempt keeps the error response so it gets logged
+                    if response.status in RETRY_STATUSES and attempt < 2:
+                        self.log(f"Server error {response.status} fetching {url} "
+                                 f"(attempt {attempt + 1}/3)", "WARNING")
+                        response.release()
+                        await asyncio.sleep(2 ** attempt)
+                        continue
+                    
+                    content_type = response.headers.get('Content-Type', '').lower()
+                    max_bytes = self.args.max_body_bytes
+                    
+                    # Skip oversized responses up front when the server says so
+                    if max_bytes and response.content_length and response.content_length > max_bytes:
+                        self.log(f"Skipping {url}: Content-Length {response.content_length} "
+                                 f"exceeds {max_bytes} bytes", "WARNING")
+                        return None, 0, "", 0
+                    
+                    # Stream the body so a huge or endless response can't exhaust memory
+                    chunks = []
+                    content_length = 0
+                    async for chunk in response.content.iter_chunked(65536):
+                        chunks.append(chunk)
+                        content_length += len(chunk)
+                        if max_bytes and content_length > max_bytes:
+                            self.log(f"Skipping {url}: body exceeds {max_bytes} bytes", "WARNING")
+                            return None, 0, "", 0
+                    
+                    return b''.join(chunks), response.status, content_type, content_length
                 
-            except requests.exceptions.Timeout:
+            except asyncio.TimeoutError:
                 self.log(f"Timeout fetching {url} (attempt {attempt + 1}/3)", "WARNING")
                 if attempt < 2:  # Don't sleep on last attempt
-                    time.sleep(2 ** attempt)  # Exponential backoff
-            except requests.exceptions.ConnectionError as e:
+                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+            except aiohttp.ClientConnectionError as e:
                 self.log(f"Connection error fetching {url}: {e} (attempt {attempt + 1}/3)", "WARNING")
                 if attempt < 2:
-                    time.sleep(2 ** attempt)
-            except requests.exceptions.RequestException as e:
+                    await asyncio.sleep(2 ** attempt)
+            except aiohttp.ClientError as e:
                 self.log(f"Request error fetching {url}: {e}", "ERROR")
                 return None, 0, "", 0
         
@@ -149,40 +418,8 @@ class Crawler:
         self.log(f"Failed to fetch {url} after 3 attempts", "ERROR")
         return None, 0, "", 0
     
-    def parse_links(self, html_content: bytes, base_url: str) -> Set[str]:
-        """
-        Parse HTML content and extract all links.
-        
-        Args:
-            html_content: Raw HTML bytes
-            base_url: Base URL for resolving relative links
-            
-        Returns:
-            Set of absolute URLs found in the page
-        """
-        links = set()
-        
-        try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Find all anchor tags with href attribute
-            for tag in soup.find_all('a', href=True):
-                href = tag['href']
-                # Resolve relative URLs
-                absolute_url = urljoin(base_url, href)
-                # Remove fragment
-                absolute_url = absolute_url.split('#')[0]
-                if absolute_url:
-                    links.add(absolute_url)
-            
-            self.log(f"Found {len(links)} links in {base_url}")
-            
-        except Exception as e:
-            self.log(f"Error parsing links from {base_url}: {e}", "ERROR")
-        
-        return links
-    
-    def should_follow(self, url: str, seed_url: str) -> bool:
+    def should_follow(self, url_netloc: str, url_path: str,
+                      seed_netloc: str, seed_prefix: str) -> bool:
         """
         Determine if a URL should be followed based on constraints.
         
@@ -191,35 +428,30 @@ class Crawler:
         - URL path starts with seed path (stay within seed path prefix)
         
         Args:
-            url: URL to check
-            seed_url: Original seed URL
+            url_netloc: Network location of the URL to check
+            url_path: Path of the URL to check
+            seed_netloc: Network location of the original seed URL
+            seed_prefix: Seed path with trailing slashes removed
             
         Returns:
             True if URL should be followed, False otherwise
         """
-        url_parsed = urlparse(url)
-        seed_parsed = urlparse(seed_url)
-        
         # Check same hostname
-        if url_parsed.netloc != seed_parsed.netloc:
+        if url_netloc != seed_netloc:
             return False
         
-        # Check path prefix
-        url_path = url_parsed.path
-        seed_path = seed_parsed.path
-        
-        # Normalize paths (remove trailing slash for comparison)
-        seed_path_prefix = seed_path.rstrip('/')
-        
         # If seed path is empty or root, allow any path on same host
-        if not seed_path_prefix or seed_path_prefix == '/':
+        if not seed_prefix:
             return True
         
         # Check if URL path starts with seed path prefix
-        if not url_path.startswith(seed_path_prefix):
-            return False
-        
-        return True
+        return url_path.startswith(seed_prefix)
+    
+    def ensure_dir(self, path: Path):
+        """Create a directory once per run instead of once per saved page."""
+        if path not in self.created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self.created_dirs.add(path)
     
     def save_raw(self, content: bytes, url: str, is_file: bool = False) -> str:
         """
@@ -233,34 +465,40 @@ class Crawler:
         Returns:
             Path where content was saved
         """
-        # Generate SHA1 hash of URL for unique filename
-        url_hash = hashlib.sha1(url.encode()).hexdigest()
+        # Generate BLAKE2b hash of URL for unique filename
+        url_hash = hash_url(url)
         
         if is_file:
             # Extract file extension from URL
-            parsed = urlparse(url)
+            parsed = parse_url(url)
             path = parsed.path
             ext = os.path.splitext(path)[1].lower()
             if not ext:
                 ext = '.bin'
             
             # Save to raw_files directory
-            self.raw_files_dir.mkdir(parents=True, exist_ok=True)
+            self.ensure_dir(self.raw_files_dir)
             filepath = self.raw_files_dir / f"{url_hash}{ext}"
         else:
             # Save HTML to date-based directory
-            date_str = datetime.now().strftime("%Y%m%d")
+            date_str = today_str()
             date_dir = self.raw_dir / date_str
-            date_dir.mkdir(parents=True, exist_ok=True)
+            self.ensure_dir(date_dir)
             
             # Extract hostname for filename
-            hostname = urlparse(url).netloc.replace(':', '_')
+            hostname = parse_url(url).netloc.replace(':', '_')
             filepath = date_dir / f"{hostname}_{url_hash}.html"
         
-        # Write content
+        # Write content with raw syscalls, bypassing Python's buffered I/O layer
         try:
-            with open(filepath, 'wb') as f:
-                f.write(content)
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+            fd = os.open(filepath, flags, 0o644)
+            try:
+                view = memoryview(content)
+                while view:  # os.write may write less than requested
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
             self.log(f"Saved content to {filepath}")
             return str(filepath)
         except Exception as e:
@@ -275,23 +513,163 @@ class Crawler:
             'status_code': status_code,
             'content_type': content_type,
             'saved_path': saved_path,
-            'crawl_date': datetime.now().isoformat(),
+            'crawl_date': datetime.now(),  # Serialized in ISO 8601 format
             'depth': depth,
             'parent_url': parent_url,
             'content_length': content_length
         }
         
         try:
-            # Ensure directory exists
-            self.index_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(self.index_file, 'a') as f:
-                f.write(json.dumps(metadata) + '\n')
+            if ORJSON_AVAILABLE:
+                line = orjson.dumps(metadata) + b'\n'
+            else:
+                line = (json.dumps(metadata, default=datetime.isoformat) + '\n').encode()
+            with self.index_lock:
+                if self.index_fh is None:
+                    # Ensure directory exists
+                    self.index_file.parent.mkdir(parents=True, exist_ok=True)
+                    self.index_fh = open(self.index_file, 'ab', buffering=1024 * 1024)
+                
+                self.index_fh.write(line)
+                self.index_records += 1
+                # Flush periodically so a crash loses at most a few records
+                if self.index_records % 100 == 0:
+                    self.index_fh.flush()
             self.log(f"Logged metadata for {url}")
         except Exception as e:
             self.log(f"Error logging metadata: {e}", "ERROR")
     
-    def crawl_seed(self, seed_url: str):
+    def close(self):
+        """Flush and close the metadata index."""
+        with self.index_lock:
+            if self.index_fh is not None:
+                self.index_fh.close()
+                self.index_fh = None
+    
+    def save_page(self, content: bytes, url: str, is_file: bool, status_code: int,
+                  content_type: str, depth: int, parent_url: str, content_length: int) -> str:
+        """Save content and log its metadata; runs on the thread pool."""
+        saved_path = self.save_raw(content, url, is_file=is_file)
+        self.log_metadata(url, status_code, content_type, saved_path,
+                          depth, parent_url, content_length)
+        return saved_path
+    
+    def wants_links(self, url: str, content_type: str, depth: int) -> bool:
+        """Check whether a crawled page is HTML whose links should be followed."""
+        return is_html_page(url, content_type) and depth < self.args.depth
+    
+    def read_saved(self, saved_path: str) -> Optional[bytes]:
+        """Read content saved by an earlier run, or None if it is gone."""
+        try:
+            return Path(saved_path).read_bytes() if saved_path else None
+        except OSError as e:
+            self.log(f"Could not read saved copy {saved_path}: {e}", "WARNING")
+            return None
+    
+    def load_resume_index(self):
+        """Load pages logged in index.jsonl by an earlier run so they are not fetched again."""
+        if not self.index_file.exists():
+            return
+        
+        loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+        with open(self.index_file, 'rb') as f:
+            for line in f:
+                try:
+                    record = loads(line)
+                    url, content_type = record['url'], record['content_type']
+                    # Only HTML pages are ever re-read, so keep just what parsing them needs
+                    resumed = None
+                    if is_html_page(url, content_type):
+                        charset = get_charset(content_type)
+                        resumed = (record['saved_path'], charset and sys.intern(charset))
+                    self.resumed_pages[UrlSet.digest(url)] = resumed
+                except (ValueError, KeyError, TypeError):
+                    continue  # e.g. a line truncated by a crash
+        self.log(f"Resuming: {len(self.resumed_pages)} page(s) already crawled")
+    
+    async def reserve_page(self) -> bool:
+        """
+        Reserve a slot in the max_pages budget for one fetch.
+        
+        While in-flight fetches fill the budget this waits, since they may still
+        fail and free their slot. Returns False once completed pages reach the limit.
+        """
+        if self.args.max_pages == 0:
+            return True
+        
+        async with self.budget_changed:
+            while self.pages_crawled + self.pages_reserved >= self.args.max_pages:
+                if self.pages_crawled >= self.args.max_pages:
+                    return False
+                await self.budget_changed.wait()
+            self.pages_reserved += 1
+            return True
+    
+    async def release_page(self, fetched: bool):
+        """End a reservation from reserve_page, counting the page if it was fetched."""
+        if fetched:
+            self.pages_crawled += 1
+        if self.args.max_pages == 0:
+            return
+        
+        async with self.budget_changed:
+            self.pages_reserved -= 1
+            self.budget_changed.notify_all()
+    
+    async def crawl_page(self, url: str, depth: int, parent_url: str) -> Tuple[Optional[bytes], str]:
+        """
+        Fetch a page politely, then save it and log its metadata.
+        
+        Returns:
+            Tuple of (content, content_type); content is None if the page was
+            disallowed, failed, or the page budget is used up
+        """
+        loop = asyncio.get_running_loop()
+        
+        # Requests to a host are serialized, even across seeds
+        host = parse_url(url).netloc
+        host_lock = self.host_locks.setdefault(host, asyncio.Lock())
+        async with host_lock:
+            # Check robots.txt
+            if not await self.can_fetch(url):
+                self.log(f"Disallowed by robots.txt: {url}", "WARNING")
+                return None, ""
+            
+            # Reserve a page slot so concurrent seeds don't overshoot max_pages
+            if not await self.reserve_page():
+                return None, ""
+            
+            content = None
+            try:
+                # Random delay between requests to the same host
+                await self.wait_for_host(host)
+                
+                # Fetch the page
+                content, status_code, content_type, content_length = await self.fetch_page(url)
+                
+                delay = random.uniform(self.args.delay_min, self.args.delay_max)
+                self.next_allowed_time[host] = loop.time() + delay
+            finally:
+                await self.release_page(fetched=content is not None)
+        
+        if content is None:
+            return None, ""
+        
+        if self.pbar:
+            self.pbar.update(1)
+        
+        # Determine if this is a file to download or HTML to parse
+        is_html = 'text/html' in content_type
+        is_file = is_file_path(parse_url(url).path)
+        
+        # Save HTML or download file off the event loop
+        await loop.run_in_executor(
+            self.executor, self.save_page, content, url, is_file or not is_html,
+            status_code, content_type, depth, parent_url, content_length)
+        
+        return content, content_type
+    
+    async def crawl_seed(self, seed_url: str):
         """
         Crawl a single seed URL recursively up to max depth.
         
@@ -299,12 +677,24 @@ class Crawler:
             seed_url: Starting URL to crawl
         """
         self.log(f"Starting crawl from seed: {seed_url}")
+        loop = asyncio.get_running_loop()
+        
+        # Parse the seed once; should_follow only compares components.
+        # Normalize it the same way as links returned by extract_links.
+        try:
+            seed = yarl.URL(seed_url).with_fragment(None)
+        except ValueError as e:
+            self.log(f"Invalid seed URL {seed_url}: {e}", "ERROR")
+            return
+        seed_netloc = seed.raw_authority
+        seed_prefix = seed.raw_path.rstrip('/')
+        link_filter = compile_link_filter(seed_netloc)
         
         # Queue: (url, depth, parent_url)
-        queue = [(seed_url, 0, "")]
+        queue = deque([(str(seed), 0, "")])
         
         while queue and (self.args.max_pages == 0 or self.pages_crawled < self.args.max_pages):
-            url, depth, parent_url = queue.pop(0)
+            url, depth, parent_url = queue.popleft()
             
             # Skip if already visited
             if url in self.visited_urls:
@@ -314,63 +704,51 @@ class Crawler:
             if depth > self.args.depth:
                 continue
             
-            # Check robots.txt
-            if not self.can_fetch(url):
-                self.log(f"Disallowed by robots.txt: {url}", "WARNING")
-                continue
-            
             # Mark as visited
             self.visited_urls.add(url)
             
-            # Random delay between requests
-            if self.pages_crawled > 0:  # Don't delay before first request
-                delay = random.uniform(self.args.delay_min, self.args.delay_max)
-                self.log(f"Waiting {delay:.2f} seconds before next request")
-                time.sleep(delay)
-            
-            # Fetch the page
-            content, status_code, content_type, content_length = self.fetch_page(url)
+            # Pages from an earlier run are re-parsed from disk instead of fetched
+            digest = UrlSet.digest(url)
+            content = None
+            if digest in self.resumed_pages:
+                resumed = self.resumed_pages.pop(digest)
+                if resumed is None or depth >= self.args.depth:
+                    continue  # Not HTML, or its links would not be followed
+                saved_path, charset = resumed
+                content = await loop.run_in_executor(self.executor, self.read_saved, saved_path)
             
             if content is None:
-                continue
-            
-            self.pages_crawled += 1
-            if self.pbar:
-                self.pbar.update(1)
+                content, content_type = await self.crawl_page(url, depth, parent_url)
+                # Parse links from HTML if we haven't reached max depth
+                if content is None or not self.wants_links(url, content_type, depth):
+                    continue
+                charset = get_charset(content_type)
             
-            # Determine if this is a file to download or HTML to parse
-            is_html = 'text/html' in content_type
-            is_file = any(ext in url.lower() for ext in ['.pdf', '.doc', '.docx'])
+            # Parse in a worker process (or thread) so other seeds keep fetching
+            try:
+                links = await loop.run_in_executor(
+                    self.parse_pool or self.executor, extract_links, content, url,
+                    charset, link_filter)
+                self.log(f"Found {len(links)} links in {url}")
+            except Exception as e:
+                self.log(f"Error parsing links from {url}: {e}", "ERROR")
+                links = set()
             
-            if is_file or not is_html:
-                # Download file
-                saved_path = self.save_raw(content, url, is_file=True)
-                self.log_metadata(url, status_code, content_type, saved_path, 
-                                depth, parent_url, content_length)
-            else:
-                # Save HTML and parse links
-                saved_path = self.save_raw(content, url, is_file=False)
-                self.log_metadata(url, status_code, content_type, saved_path, 
-                                depth, parent_url, content_length)
-                
-                # Parse links if we haven't reached max depth
-                if depth < self.args.depth:
-                    links = self.parse_links(content, url)
-                    
-                    # Add links to queue if they should be followed
-                    for link in links:
-                        if link not in self.visited_urls and self.should_follow(link, seed_url):
-                            # Check if it's a file link
-                            if any(ext in link.lower() for ext in ['.pdf', '.doc', '.docx']):
-                                # Add file links at same depth (don't recurse from files)
-                                queue.append((link, depth, url))
-                            else:
-                                # Add HTML links at next depth
-                                queue.append((link, depth + 1, url))
+            # Add links to queue if they should be followed
+            for link, link_netloc, link_path in links:
+                if (link not in self.visited_urls and
+                        self.should_follow(link_netloc, link_path, seed_netloc, seed_prefix)):
+                    # Check if it's a file link
+                    if is_file_path(link_path):
+                        # Add file links at same depth (don't recurse from files)
+                        queue.append((link, depth, url))
+                    else:
+                        # Add HTML links at next depth
+                        queue.append((link, depth + 1, url))
         
         self.log(f"Completed crawl from seed: {seed_url}")
     
-    def run(self):
+    async def run(self):
         """Main entry point for the crawler."""
         seeds = self.read_seeds()
         
@@ -381,13 +759,42 @@ class Crawler:
         self.log(f"Starting crawler with {len(seeds)} seed(s)")
         self.log(f"Max depth: {self.args.depth}, Max pages: {self.args.max_pages}")
         self.log(f"Delay range: {self.args.delay_min}-{self.args.delay_max} seconds")
+        self.log(f"Concurrency: {self.args.concurrency} seed(s) at a time")
         
-        for seed in seeds:
-            if self.args.max_pages > 0 and self.pages_crawled >= self.args.max_pages:
-                self.log("Reached max pages limit", "INFO")
-                break
-            
-            self.crawl_seed(seed)
+        if self.args.resume:
+            self.load_resume_index()
+        
+        # Each seed has at most one request in flight per host, so size the
+        # pool to the concurrency
+        connector = aiohttp.TCPConnector(limit=self.args.concurrency * 2, limit_per_host=2)
+        # Like requests' timeout=30: only stalled connects or reads time out,
+        # so large downloads that keep making progress are not cut off
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=30)
+        seed_slots = asyncio.Semaphore(self.args.concurrency)
+        
+        async def crawl_bounded(seed: str):
+            async with seed_slots:
+                await self.crawl_seed(seed)
+        
+        # Parsing is CPU-bound, so optionally spread it across processes
+        parse_processes = self.args.parse_processes
+        parse_pool = ProcessPoolExecutor(max_workers=parse_processes) if parse_processes else nullcontext()
+        
+        try:
+            # Disk writes (and parsing, without a process pool) run on threads
+            # sized to the crawl concurrency
+            with ThreadPoolExecutor(max_workers=self.args.concurrency) as executor, parse_pool:
+                self.executor = executor
+                self.parse_pool = parse_pool if parse_processes else None
+                async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                                 headers={'User-Agent': self.args.user_agent}) as session:
+                    self.session = session
+                    await asyncio.gather(*(crawl_bounded(seed) for seed in seeds))
+        finally:
+            self.close()
+        
+        if self.args.max_pages > 0 and self.pages_crawled >= self.args.max_pages:
+            self.log("Reached max pages limit", "INFO")
         
         if self.pbar:
             self.pbar.close()
@@ -444,6 +851,41 @@ def main():
         help='User agent string to use for requests'
     )
     
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=4,
+        help='Number of seeds crawled in parallel (requests to one host stay sequential)'
+    )
+    
+    parser.add_argument(
+        '--parse-processes',
+        type=int,
+        default=0,
+        help='Worker processes for HTML parsing (0 parses on the thread pool; '
+             'use the CPU count for large crawls)'
+    )
+    
+    parser.add_argument(
+        '--max-body-bytes',
+        type=int,
+        default=50 * 1024 * 1024,
+        help='Skip responses larger than this many bytes (0 for unlimited)'
+    )
+    
+    parser.add_argument(
+        '--robots-ttl',
+        type=int,
+        default=86400,
+        help='Seconds to reuse robots.txt files cached on disk (0 to disable)'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Skip pages already logged in data/raw/index.jsonl, following their links from the saved copies'
+    )
+    
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -469,9 +911,25 @@ def main():
         print("Error: Max pages must be non-negative", file=sys.stderr)
         sys.exit(1)
     
+    if args.concurrency < 1:
+        print("Error: Concurrency must be at least 1", file=sys.stderr)
+        sys.exit(1)
+    
+    if args.parse_processes < 0:
+        print("Error: Parse processes must be non-negative", file=sys.stderr)
+        sys.exit(1)
+    
+    if args.max_body_bytes < 0:
+        print("Error: Max body bytes must be non-negative", file=sys.stderr)
+        sys.exit(1)
+    
+    if args.robots_ttl < 0:
+        print("Error: Robots TTL must be non-negative", file=sys.stderr)
+        sys.exit(1)
+    
     # Create and run crawler
     crawler = Crawler(args)
-    crawler.run()
+    asyncio.run(crawler.run())
 
 
 if __name__ == '__main__':
@@ -4,6 +4,7 @@ Simple tests for the crawler module.
 Tests key functionality without requiring external dependencies.
 """
 
+import asyncio
 import sys
 import os
 import tempfile
@@ -34,47 +35,35 @@ def test_should_follow():
     
     c = crawler.Crawler(MockArgs())
     
+    docs = urlparse("https://example.com/docs/")
+    docs_netloc, docs_prefix = docs.netloc, docs.path.rstrip('/')
+    
     # Test same hostname and path prefix
     assert c.should_follow(
-        "https://example.com/docs/page1",
-        "https://example.com/docs/"
+        "example.com", "/docs/page1", docs_netloc, docs_prefix
     ), "Should follow same hostname and path prefix"
     
     # Test different hostname
     assert not c.should_follow(
-        "https://other.com/docs/",
-        "https://example.com/docs/"
+        "other.com", "/docs/", docs_netloc, docs_prefix
     ), "Should not follow different hostname"
     
     # Test wrong path prefix
     assert not c.should_follow(
-        "https://example.com/blog/",
-        "https://example.com/docs/"
+        "example.com", "/blog/", docs_netloc, docs_prefix
     ), "Should not follow wrong path prefix"
     
     # Test root path allows all
     assert c.should_follow(
-        "https://example.com/anything",
-        "https://example.com/"
+        "example.com", "/anything", "example.com", ""
     ), "Root path should allow any path"
     
     print("✓ should_follow tests passed")
 
 
-def test_parse_links():
+def test_extract_links():
     """Test link parsing."""
-    print("Testing parse_links...")
-    
-    class MockArgs:
-        seeds = "seeds.txt"
-        depth = 3
-        delay_min = 1.0
-        delay_max = 3.0
-        max_pages = 0
-        user_agent = "Test"
-        verbose = False
-    
-    c = crawler.Crawler(MockArgs())
+    print("Testing extract_links...")
     
     html = b'''
     <html>
@@ -83,18 +72,53 @@ def test_parse_links():
         <a href="/page2">Page 2</a>
         <a href="https://example.com/page3">Page 3</a>
         <a href="#anchor">Anchor</a>
+        <a href="/page4#section">Page 4</a>
     </body>
     </html>
     '''
     
-    links = c.parse_links(html, "https://example.com/")
+    links = {url for url, netloc, path in crawler.extract_links(html, "https://example.com/")}
     
     assert "https://example.com/page1" in links, "Should find relative link 1"
     assert "https://example.com/page2" in links, "Should find relative link 2"
     assert "https://example.com/page3" in links, "Should find absolute link"
-    # Anchors are stripped, so just the base URL should be in links
+    assert "https://example.com/page4" in links, "Should strip fragment"
+    
+    # Hrefs to other hosts or schemes are dropped by the prefilter
+    html = b'''
+        <a href="page5">Page 5</a>
+        <a href="//EXAMPLE.com/page6">Page 6</a>
+        <a href="https://other.com/page7">Other</a>
+        <a href="//example.com.evil/page8">Lookalike</a>
+        <a href="mailto:someone@example.com">Mail</a>
+    '''
+    link_filter = crawler.compile_link_filter("example.com")
+    links = {url for url, netloc, path in crawler.extract_links(html, "https://example.com/", None, link_filter)}
+    
+    assert links == {"https://example.com/page5", "https://example.com/page6"}, \
+        f"Should keep only same-host and relative links, got {links}"
+    
+    # Unicode hrefs still reach yarl when the seed host is internationalized
+    html = '<a href="http://bücher.de/x">IDN</a>'.encode()
+    link_filter = crawler.compile_link_filter("xn--bcher-kva.de")
+    links = crawler.extract_links(html, "https://xn--bcher-kva.de/", "utf-8", link_filter)
+    
+    assert ("http://xn--bcher-kva.de/x", "xn--bcher-kva.de", "/x") in links, \
+        f"Should keep Unicode link to the seed host, got {links}"
+    
+    print("✓ extract_links tests passed")
+
+
+def test_is_file_path():
+    """Test detecting downloadable documents by path extension."""
+    print("Testing is_file_path...")
+    
+    assert crawler.is_file_path("/docs/report.pdf"), "Should detect .pdf"
+    assert crawler.is_file_path("/docs/REPORT.DOCX"), "Should ignore extension case"
+    assert not crawler.is_file_path("/docs/report.pdf.html"), "Should only check final extension"
+    assert not crawler.is_file_path("/docs/"), "Should not treat directories as files"
     
-    print("✓ parse_links tests passed")
+    print("✓ is_file_path tests passed")
 
 
 def test_read_seeds():
@@ -179,15 +203,247 @@ def test_save_raw():
         shutil.rmtree(temp_dir)
 
 
+def test_crawl_seed():
+    """Test crawling a local site end to end."""
+    print("Testing crawl_seed...")
+    
+    from aiohttp import web
+    
+    pages = {
+        '/robots.txt': ('text/plain', b"User-agent: *\nDisallow: /docs/private\n"),
+        '/docs/': ('text/html', b'<a href="page1">1</a><a href="private/x">x</a>'
+                                b'<a href="/blog/">blog</a>'),
+        '/docs/flaky': ('text/html', b'<p>ok</p>'),
+        '/docs/page1': ('text/html', b'<a href="/docs/">back</a><a href="big.pdf">big</a>'
+                                     b'<a href="flaky">flaky</a><a href="stream.pdf">stream</a>'),
+        '/docs/big.pdf': ('application/pdf', b'x' * 4096),
+    }
+    
+    attempts = {'/docs/flaky': 0, '/docs/stream.pdf': 0}
+    
+    async def handler(request):
+        # Chunked body without Content-Length, so only the streaming cap applies
+        if request.path == '/docs/stream.pdf':
+            attempts[request.path] += 1
+            response = web.StreamResponse(headers={'Content-Type': 'application/pdf'})
+            response.enable_chunked_encoding()
+            await response.prepare(request)
+            for _ in range(4):
+                await response.write(b'x' * 1024)
+            await response.write_eof()
+            return response
+        # Fail the first request to exercise the retry path
+        if request.path == '/docs/flaky':
+            attempts[request.path] += 1
+            if attempts[request.path] == 1:
+                raise web.HTTPServiceUnavailable()
+        if request.path not in pages:
+            raise web.HTTPNotFound()
+        content_type, body = pages[request.path]
+        return web.Response(body=body, content_type=content_type)
+    
+    async def crawl():
+        app = web.Application()
+        app.router.add_get('/{tail:.*}', handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        try:
+            class MockArgs:
+                seeds = "seeds.txt"
+                depth = 3
+                delay_min = 0.0
+                delay_max = 0.0
+                max_pages = 0
+                concurrency = 2
+                parse_processes = 2
+                max_body_bytes = 1024
+                robots_ttl = 86400
+                resume = False
+                user_agent = "Test"
+                verbose = False
+            
+            c = crawler.Crawler(MockArgs())
+            with open("seeds.txt", "w") as f:
+                f.write(f"http://127.0.0.1:{port}/docs/\n")
+            await c.run()
+            
+            # A resumed run follows links from the saved pages without refetching
+            MockArgs.resume = True
+            resumed = crawler.Crawler(MockArgs())
+            await resumed.run()
+            return c, resumed, port
+        finally:
+            await runner.cleanup()
+    
+    temp_dir = tempfile.mkdtemp()
+    original_cwd = os.getcwd()
+    
+    try:
+        os.chdir(temp_dir)
+        c, resumed, port = asyncio.run(crawl())
+        base = f"http://127.0.0.1:{port}"
+        
+        # Counted: /docs/, /docs/page1 and /docs/flaky (after its retry).
+        # Not counted: private/x is disallowed by robots.txt so never fetched,
+        # big.pdf declares a Content-Length over max_body_bytes, and
+        # stream.pdf goes over max_body_bytes while its body is streamed.
+        assert c.pages_crawled == 3, f"Should crawl 3 pages, crawled {c.pages_crawled}"
+        assert f"{base}/docs/page1" in c.visited_urls, "Should follow in-prefix link"
+        assert f"{base}/blog/" not in c.visited_urls, "Should not follow out-of-prefix link"
+        assert attempts['/docs/flaky'] == 2, "Should retry a 503 response once"
+        assert attempts['/docs/stream.pdf'] >= 1, "Should request the streamed PDF"
+        
+        with open(c.index_file) as f:
+            assert len(f.readlines()) == 3, "Should log metadata for each page"
+        
+        assert len(list(c.robots_cache_dir.iterdir())) == 1, "Should cache robots.txt on disk"
+        
+        assert resumed.pages_crawled == 0, "Resumed run should not refetch logged pages"
+        assert f"{base}/docs/flaky" in resumed.visited_urls, "Resumed run should follow saved links"
+        assert not resumed.resumed_pages, "Resumed entries should be freed once reached"
+        
+        print("✓ crawl_seed tests passed")
+    finally:
+        os.chdir(original_cwd)
+        shutil.rmtree(temp_dir)
+
+
+def test_max_pages_with_failed_fetch():
+    """Test that a failed fetch frees its page slot for other seeds."""
+    print("Testing max_pages with a failed fetch...")
+    
+    from aiohttp import web
+    
+    async def handler(request):
+        if request.path == '/a/':
+            return web.Response(body=b'<a href="slow.pdf">slow</a>', content_type='text/html')
+        if request.path == '/a/slow.pdf':
+            # Slow oversized body keeps its page slot reserved, then fails the cap
+            response = web.StreamResponse(headers={'Content-Type': 'application/pdf'})
+            response.enable_chunked_encoding()
+            await response.prepare(request)
+            for _ in range(4):
+                await asyncio.sleep(0.1)
+                await response.write(b'x' * 1024)
+            await response.write_eof()
+            return response
+        if request.path == '/b/':
+            return web.Response(body=b'<a href="1">1</a><a href="2">2</a>', content_type='text/html')
+        if request.path in ('/b/1', '/b/2'):
+            return web.Response(body=b'<p>ok</p>', content_type='text/html')
+        raise web.HTTPNotFound()
+    
+    async def crawl():
+        # Two servers on different ports act as two hosts
+        runners = []
+        ports = []
+        for _ in range(2):
+            app = web.Application()
+            app.router.add_get('/{tail:.*}', handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            await web.TCPSite(runner, '127.0.0.1', 0).start()
+            runners.append(runner)
+            ports.append(runner.addresses[0][1])
+        try:
+            class MockArgs:
+                seeds = "seeds.txt"
+                depth = 3
+                delay_min = 0.0
+                delay_max = 0.0
+                max_pages = 3
+                concurrency = 2
+                parse_processes = 0
+                max_body_bytes = 1024
+                robots_ttl = 0
+                resume = False
+                user_agent = "Test"
+                verbose = False
+            
+            with open("seeds.txt", "w") as f:
+                f.write(f"http://127.0.0.1:{ports[0]}/a/\n")
+                f.write(f"http://127.0.0.1:{ports[1]}/b/\n")
+            c = crawler.Crawler(MockArgs())
+            await c.run()
+            return c
+        finally:
+            for runner in runners:
+                await runner.cleanup()
+    
+    temp_dir = tempfile.mkdtemp()
+    original_cwd = os.getcwd()
+    
+    try:
+        os.chdir(temp_dir)
+        c = asyncio.run(crawl())
+        
+        # /a/ and /b/ succeed, slow.pdf fails, so one of /b/1 and /b/2 fills the budget
+        assert c.pages_crawled == 3, f"Should crawl 3 pages, crawled {c.pages_crawled}"
+        assert c.pages_reserved == 0, "Should release every reservation"
+        
+        print("✓ max_pages tests passed")
+    finally:
+        os.chdir(original_cwd)
+        shutil.rmtree(temp_dir)
+
+
+def test_robots_cache():
+    """Test loading robots.txt from the on-disk cache."""
+    print("Testing robots cache...")
+    
+    temp_dir = tempfile.mkdtemp()
+    original_cwd = os.getcwd()
+    
+    try:
+        os.chdir(temp_dir)
+        
+        class MockArgs:
+            seeds = "seeds.txt"
+            depth = 3
+            delay_min = 1.0
+            delay_max = 3.0
+            max_pages = 0
+            robots_ttl = 86400
+            user_agent = "Test"
+            verbose = False
+        
+        c = crawler.Crawler(MockArgs())
+        
+        # Cached robots.txt is used without a session, i.e. without fetching
+        cache_path = c.robots_cache_path("https://example.com")
+        c.write_robots_cache(cache_path, "User-agent: *\nDisallow: /private\n")
+        
+        assert asyncio.run(c.can_fetch("https://example.com/docs/")), "Should allow public path"
+        assert not asyncio.run(c.can_fetch("https://example.com/private/x")), \
+            "Should disallow path from cached robots.txt"
+        
+        # Expired cache entries are ignored
+        old = cache_path.stat().st_mtime - 2 * MockArgs.robots_ttl
+        os.utime(cache_path, (old, old))
+        assert c.read_robots_cache(cache_path) is None, "Should ignore expired cache"
+        
+        print("✓ robots cache tests passed")
+    finally:
+        os.chdir(original_cwd)
+        shutil.rmtree(temp_dir)
+
+
 def main():
     """Run all tests."""
     print("Running crawler tests...\n")
     
     try:
         test_should_follow()
-        test_parse_links()
+        test_extract_links()
+        test_is_file_path()
         test_read_seeds()
         test_save_raw()
+        test_robots_cache()
+        test_crawl_seed()
+        test_max_pages_with_failed_fetch()
         
         print("\n✓ All tests passed!")
         return 0